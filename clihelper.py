@@ -14,10 +14,24 @@
 from sys import stderr as standard_error
 # import os.path
 from os import path as path_check
+# import counter
+from collections import Counter
 # import type checks
 import type_check
 # initialise version
 VERSION = "1.4"
+# initialise translation table to strip brackets and split pipes in patterns
+_CONTROL_TABLE = str.maketrans("|", " ", "[]{}")
+# initialise pattern bracket characters
+_OPEN_BRACKETS = frozenset("{[")
+_CLOSE_BRACKETS = {"{": "}", "[": "]"}
+_ELEMENT_SEPARATORS = frozenset(" }]")
+# initialise help column headers
+_COLUMN_HEADERS = ("ARGUMENT", "VALUE", "DESCRIPTION", "DEFAULT VALUE")
+# initialise file error messages
+_FILE_ERROR_MESSAGES = {PermissionError: "Permission denied when accessing file {}",
+                        FileNotFoundError: "Could not locate file {}",
+                        FileExistsError: "File {} already exists"}
 
 
 # interface class
@@ -39,12 +53,21 @@ class Interface:
         self.long_description = long_description
         self.pattern_tree = pattern_tree
         self.parameter_information = parameter_information
+        # initialise parameter information index
+        self._param_by_flag = {}
+        # initialise tokenised pattern cache
+        self._pattern_cache = {}
         # initialise current internal command path
         self.internal_command_path = []
+        # initialise resolved caller address and error wrapping
+        self._caller_address = None
+        self._error_prefix = ""
+        self._error_suffix = ""
         # initialise argument results, argument scan an given arguments
-        self.argument_results = []
+        self.argument_results = {}
         self.argument_scan = []
         self.given_arguments = []
+        self._given_counts = Counter()
 
     # unpack command path into a string
     def unpack_command_path(self, given_path):
@@ -53,13 +76,21 @@ class Interface:
             ITER given_path - a list containing the path elements
         gives:
             STR string_path - the internal command path as a string"""
-        # initialise string path
-        string_path = given_path[0]
-        # add path element to string path
-        for command in given_path[1:]:
-            string_path += " " + command
-        # return string path
-        return string_path
+        # join path elements into string path
+        return " ".join(given_path)
+
+    # get the caller address
+    def get_caller_address(self):
+        """gets the internal command path as a string, falling back to the script name
+        takes:
+            None
+        gives:
+            STR caller_address - the address to show the user in messages"""
+        # use the resolved address once parse has settled the command path
+        if self._caller_address is not None:
+            return self._caller_address
+        # unpack internal command path
+        return self.unpack_command_path(self.internal_command_path if self.internal_command_path else [self.script_name])
 
     # unpack pattern tree into list
     def unpack_pattern_tree(self, given_pattern):
@@ -73,7 +104,7 @@ class Interface:
         # iterate over pattern keys
         for key in given_pattern:
             # if content is a pattern
-            if type(given_pattern[key]) == str:
+            if type(given_pattern[key]) is str:
                 # add pattern to pattern list
                 pattern_list.append(key + " " + given_pattern[key])
             # if content is a sub tree
@@ -95,75 +126,56 @@ class Interface:
         for command in (self.internal_command_path if self.internal_command_path else [self.script_name]):
             target_patterns = target_patterns[command]
         # unpack pattern sub tree
-        if type(target_patterns) == dict:
+        if type(target_patterns) is dict:
             target_patterns = self.unpack_pattern_tree(target_patterns)
         else:
             target_patterns = [target_patterns]
         # unpack internal command path
-        caller_address = self.unpack_command_path(self.internal_command_path if self.internal_command_path else [self.script_name])
-        # print usage header
+        caller_address = self.get_caller_address()
+        # add usage header
         usage_message = "Usage: " + caller_address + " "
-        print(usage_message + target_patterns[0])
-        # print additional patterns if applicable
+        help_lines = [usage_message + target_patterns[0]]
+        # add additional patterns if applicable
+        usage_indent = " " * len(usage_message)
         for pattern in target_patterns[1:]:
-            print(" " * len(usage_message) + pattern)
-        # print out short description
-        print("\n" + self.script_description + "\n")
-        # construct flag information
-        present_arguments = []
-        for pattern in target_patterns:
-            # look at each argument in the pattern
-            for argument in pattern.split(" "):
-                # remove all control characters
-                for character in ["[", "]", "{", "}", "|"]:
-                    argument = argument.replace(character, "")
-                # skip input values
-                if argument.startswith("<"):
-                    continue
-                # add flag to present flags
-                else:
-                    present_arguments.append(argument)
-        # print out argument information
+            help_lines.append(usage_indent + pattern)
+        # add short description
+        help_lines.append("\n" + self.script_description + "\n")
+        # construct flag information from each pattern with all control characters removed, skipping blanks and input values
+        present_arguments = {argument for pattern in target_patterns for argument in pattern.translate(_CONTROL_TABLE).split(" ")
+                             if argument and not argument.startswith("<")}
+        # add argument information
         if present_arguments:
             # initialise columns
             columns = [[], [], [], []]
             for information in self.parameter_information:
                 if information[0] in present_arguments:
-                    # add values to columns
-                    for value_index in range(len(information)):
-                        columns[value_index].append(information[value_index])
-            # initialise max widths
-            max_widths = []
+                    # add values to columns, padding short entries with blank cells
+                    for value_index in range(len(columns)):
+                        columns[value_index].append(information[value_index] if value_index < len(information) else "")
+            # initialise used columns
+            used_columns = []
             # add headers
             for column_index in range(len(columns)):
                 # if the column is used
                 if any(columns[column_index]):
                     # add the header
-                    columns[column_index] = [{0:"ARGUMENT", 1:"VALUE", 2:"DESCRIPTION", 3:"DEFAULT VALUE"}[column_index]] + columns[column_index]
-                    # add to max widths
-                    max_widths.append(max([len(value) for value in columns[column_index]]))
-                # set the column to unused
-                else:
-                    max_widths.append(0)
-            # print out columns
-            print("Argument Information:\n")
-            for row_index in range(len(columns[0])):
-                # start row
-                print("\t", end="")
-                for column_index in range(len(max_widths)):
-                    # skip unused columns
-                    if max_widths[column_index] == 0:
-                        continue
-                    # print out padded string
-                    else:
-                        print(columns[column_index][row_index].ljust(max_widths[column_index], " "), end="    ")
-                # end row with newline
-                print()
-        # print long description
+                    columns[column_index] = [_COLUMN_HEADERS[column_index]] + columns[column_index]
+                    # add the column with its width, including the column separator, to used columns
+                    used_columns.append((columns[column_index], max(map(len, columns[column_index])) + 4))
+            # add columns
+            help_lines.append("Argument Information:\n")
+            used_widths = [width for column, width in used_columns]
+            for row in zip(*[column for column, width in used_columns]):
+                # add row of padded strings for used columns
+                help_lines.append("\t" + "".join([value.ljust(width, " ") for value, width in zip(row, used_widths)]))
+        # add long description
         if self.long_description:
-            print("\n" + self.long_description + "\n")
+            help_lines.append("\n" + self.long_description + "\n")
         else:
-            print()
+            help_lines.append("")
+        # print help message
+        print("\n".join(help_lines))
 
     # display error to user
     def display_error(self, message):
@@ -172,74 +184,40 @@ class Interface:
             STR message - the error to display to the user
         gives:
             None"""
-        # unpack internal command path
-        caller_address = self.unpack_command_path(self.internal_command_path if self.internal_command_path else [self.script_name])
-        # print message to standard error
-        print(caller_address + ": " + message + "\n\tTry: '" + caller_address + " --help' for more info", file=standard_error)
+        # use the resolved error wrapping once parse has settled the command path
+        if self._caller_address is not None:
+            error_prefix = self._error_prefix
+            error_suffix = self._error_suffix
+        else:
+            # unpack internal command path
+            caller_address = self.get_caller_address()
+            error_prefix = caller_address + ": "
+            error_suffix = "\n\tTry: '" + caller_address + " --help' for more info\n"
+        # write message to standard error
+        standard_error.write(error_prefix + message + error_suffix)
 
-    # scan pattern
-    def scan_pattern(self, pattern, depth, parent):
-        """recursively scans the arguments to match to pattern and updates argument_results with the findings
+    # tokenise pattern
+    def tokenise_pattern(self, pattern):
+        """splits a bracketed pattern into its parts, caching the result for later scans
         takes:
-            STR pattern - the pattern to match against
+            STR pattern - the bracketed pattern to tokenise
         gives:
-            ITER - a list of all present flags"""
+            TUPLE tokens - the mode, the stripped pattern, its parts, its wrapped sub patterns (None for the base case) and whether they are piped"""
+        # reuse a previous tokenisation of this pattern
+        tokens = self._pattern_cache.get(pattern)
+        if tokens is not None:
+            return tokens
         # get element mode and strip brackets
         mode = pattern[0]
+        bracketed_pattern = pattern
         pattern = pattern[1:-1]
         pattern_parts = pattern.split(" ")
         # sanitise mode
-        if mode not in ("{", "["):
+        if mode not in _OPEN_BRACKETS:
             raise SyntaxError("Mode for pattern " + pattern + " is not valid")
-        # run the base case
+        # detect the base case
         if (len(pattern_parts) == 1 or (len(pattern_parts) == 2 and pattern_parts[1][0] == "<")) and all("|" not in part for part in pattern_parts):
-            # check if pattern part is in arguments
-            if pattern_parts[0] in self.given_arguments:
-                # set up value to append
-                if len(pattern_parts) == 2:
-                    try:
-                        value_index = self.given_arguments.index(pattern_parts[0]) + 1
-                        append_value = self.given_arguments[value_index]
-                        # remove that value from given arguments
-                        self.given_arguments = self.given_arguments[:value_index] + self.given_arguments[value_index + 1:]
-                        # detect missing argument
-                        if append_value.startswith("-"):
-                            raise IndexError()
-                    except IndexError:
-                        self.display_error("Missing argument for flag " + pattern_parts[0])
-                        exit(1)
-                    # detect correct typing
-                    if self.assert_typing and pattern_parts[1] in type_check.type_dict and not type_check.type_dict[pattern_parts[1]](append_value):
-                        # alert the user to bad type
-                        self.display_error("Incorrect type for " + pattern_parts[0])
-                        exit(1)
-                else:
-                    append_value = True
-                # remove flag from given arguments
-                self.given_arguments.remove(pattern_parts[0])
-                # add result to results collection
-                self.argument_results.append((pattern_parts[0], append_value))
-                return [pattern_parts[0]]
-            # detect unassigned value
-            elif pattern_parts[0].startswith("<") and (depth == 1 or (depth == 0 and len(pattern_parts) == 1)):
-                try:
-                    # remove the unassigned value
-                    append_value = self.given_arguments.pop()
-                    # detect missing argument
-                    if append_value.startswith("-"):
-                        raise IndexError()
-                except IndexError:
-                    self.display_error("Missing argument " + pattern_parts[0])
-            # add default values
-            else:
-                # set up append value
-                append_value = self.parameter_information[[entry[0] for entry in self.parameter_information].index(pattern_parts[0])][2]
-                if not append_value:
-                    append_value = False
-                # add result to results collection
-                self.argument_results.append((pattern_parts[0], append_value))
-                return ["-*"] if mode == "[" else []
-        # run the recursion
+            tokens = (mode, pattern, tuple(pattern_parts), None, False)
         else:
             # get elements
             pattern_parts = []
@@ -247,11 +225,11 @@ class Interface:
             base_pointer = 0
             for current_pointer in range(len(pattern)):
                 # detect open bracketed element
-                if pattern[current_pointer] in ("{", "[") and not match_character:
+                if pattern[current_pointer] in _OPEN_BRACKETS and not match_character:
                     # update match character
-                    match_character = {"{": "}", "[": "]"}[pattern[current_pointer]]
+                    match_character = _CLOSE_BRACKETS[pattern[current_pointer]]
                     # cycle base pointer
-                    while pattern[base_pointer] in (" ", "}", "]"):
+                    while pattern[base_pointer] in _ELEMENT_SEPARATORS:
                         base_pointer += 1
                     # add current scanned element to pattern parts
                     if pattern[base_pointer:current_pointer]:
@@ -270,7 +248,7 @@ class Interface:
                 # detect end of element
                 elif not match_character and pattern[current_pointer] == " " and current_pointer != len(pattern) - 1 and pattern[current_pointer + 1] != "<":
                     # cycle base pointer
-                    while pattern[base_pointer] in (" ", "}", "]") and base_pointer < current_pointer:
+                    while pattern[base_pointer] in _ELEMENT_SEPARATORS and base_pointer < current_pointer:
                         base_pointer += 1
                     # add current scanned element to pattern parts
                     if pattern[base_pointer:current_pointer]:
@@ -278,7 +256,7 @@ class Interface:
                     # update base pointer
                     base_pointer = current_pointer
             # last cycle of base pointer
-            while base_pointer <= current_pointer and pattern[base_pointer] in (" ", "}", "]"):
+            while base_pointer <= current_pointer and pattern[base_pointer] in _ELEMENT_SEPARATORS:
                 base_pointer += 1
             # add final scanned element to pattern parts
             if pattern[base_pointer:]:
@@ -289,7 +267,7 @@ class Interface:
             pipe_parts = []
             # detect pipes
             for current_pointer in range(len(pattern_parts)):
-                if "|" in pattern_parts[current_pointer] and pattern_parts[current_pointer][0] not in ["{", "["]:
+                if "|" in pattern_parts[current_pointer] and pattern_parts[current_pointer][0] not in _OPEN_BRACKETS:
                     # split pattern part into pipe parts
                     pipe_split = pattern_parts[current_pointer].split("|")
                     # add pipe splits to pipe parts
@@ -310,83 +288,167 @@ class Interface:
             # add last pattern part to pipe parts
             pipe_parts.append(" ".join([to_pipe] + pattern_parts[base_pointer:]).strip(" "))
             # remove all blanks
-            while "" in pipe_parts:
-                pipe_parts.remove("")
-            # evaluate parts with pipes
-            if len(pipe_parts) > 1:
+            pipe_parts = [pipe_part for pipe_part in pipe_parts if pipe_part]
+            # select the parts to evaluate
+            has_pipes = len(pipe_parts) > 1
+            subpatterns = []
+            for subpattern in (pipe_parts if has_pipes else pattern_parts):
+                # add inherited wrapping if necessary
+                if subpattern[0] not in _OPEN_BRACKETS:
+                    subpattern = mode + subpattern + _CLOSE_BRACKETS[mode]
+                subpatterns.append(subpattern)
+            tokens = (mode, pattern, tuple(pattern_parts), tuple(subpatterns), has_pipes)
+        # cache the tokens
+        self._pattern_cache[bracketed_pattern] = tokens
+        return tokens
+
+    # scan flag
+    def scan_flag(self, mode, pattern_parts, depth):
+        """scans the arguments for a single flag (or unassigned value) and updates argument_results with the finding
+        takes:
+            STR mode - the bracket the flag is wrapped in
+            ITER pattern_parts - the flag and its optional value type
+            INT depth - the depth of the flag in the pattern
+        gives:
+            ITER - a list of all present flags"""
+        # check if pattern part is in arguments
+        if self._given_counts[pattern_parts[0]]:
+            # locate the flag in the arguments
+            flag_index = self.given_arguments.index(pattern_parts[0])
+            # set up value to append
+            if len(pattern_parts) == 2:
+                try:
+                    append_value = self.given_arguments[flag_index + 1]
+                    # detect missing argument
+                    if append_value.startswith("-"):
+                        raise IndexError()
+                except IndexError:
+                    self.display_error("Missing argument for flag " + pattern_parts[0])
+                    exit(1)
+                # detect correct typing
+                type_checker = type_check.type_dict.get(pattern_parts[1]) if self.assert_typing else None
+                if type_checker is not None and not type_checker(append_value):
+                    # alert the user to bad type
+                    self.display_error("Incorrect type for " + pattern_parts[0])
+                    exit(1)
+                # remove that value from given arguments
+                del self.given_arguments[flag_index + 1]
+                self._given_counts[append_value] -= 1
+            else:
+                append_value = True
+            # remove flag from given arguments
+            del self.given_arguments[flag_index]
+            self._given_counts[pattern_parts[0]] -= 1
+            # add result to results collection
+            self.argument_results[pattern_parts[0]] = append_value
+            return [pattern_parts[0]]
+        # detect unassigned value
+        elif pattern_parts[0].startswith("<") and (depth == 1 or (depth == 0 and len(pattern_parts) == 1)):
+            try:
+                # remove the unassigned value
+                append_value = self.given_arguments.pop()
+                self._given_counts[append_value] -= 1
+                # detect missing argument
+                if append_value.startswith("-"):
+                    raise IndexError()
+            except IndexError:
+                self.display_error("Missing argument " + pattern_parts[0])
+        # add default values
+        else:
+            # set up append value
+            information = self._param_by_flag.get(pattern_parts[0])
+            if information is None:
+                raise ValueError("No parameter information for flag " + pattern_parts[0])
+            append_value = information[2]
+            if not append_value:
+                append_value = False
+            # add result to results collection
+            self.argument_results[pattern_parts[0]] = append_value
+            return ["-*"] if mode == "[" else []
+
+    # scan pattern
+    def scan_pattern(self, pattern, depth, parent):
+        """recursively scans the arguments to match to pattern and updates argument_results with the findings
+        takes:
+            STR pattern - the pattern to match against
+        gives:
+            ITER - a list of all present flags"""
+        # get element mode, stripped pattern and parts
+        mode, pattern, pattern_parts, subpatterns, has_pipes = self.tokenise_pattern(pattern)
+        # run the base case
+        if subpatterns is None:
+            return self.scan_flag(mode, pattern_parts, depth)
+        # evaluate parts with pipes
+        elif has_pipes:
+            # initialise responses
+            pipe_responses = []
+            # get responses from evaluating sub-patterns
+            for subpattern in subpatterns:
+                sub_mode, _, sub_parts, sub_subpatterns, _ = self.tokenise_pattern(subpattern)
+                # evaluate single flags directly
+                if sub_subpatterns is None:
+                    pipe_responses.append(self.scan_flag(sub_mode, sub_parts, depth + 1))
+                # evaluate the sub pattern
+                else:
+                    pipe_responses.append(self.scan_pattern(subpattern, depth + 1, "|"))
+            # count the matches
+            match_count = sum(map(bool, pipe_responses))
+            # check there is no more than 2
+            if match_count >= 2:
+                # alert user to invalid arguments
+                self.display_error("Only one part of " + pattern + " can be filled")
+                exit(1)
+            # required mode
+            if mode == "{":
+                # check there is exclusively one match
+                if match_count != 1:
+                    # alert user to invalid arguments
+                    self.display_error("There must be exactly one part of " + pattern + " filled")
+                    exit(1)
+            # initialise return flags
+            return_flags = []
+            # return all set flags
+            for response in pipe_responses:
+                for flag in response:
+                    return_flags.append(flag)
+            return return_flags
+        # evaluate parts without pipes
+        else:
+            # required mode
+            if mode == "{":
                 # initialise responses
-                pipe_responses = []
-                # get responses from evaluating sub-patterns
-                for subpattern in pipe_parts:
-                    # add inherited wrapping if necessary
-                    if subpattern[0] not in ("{", "["):
-                        subpattern = mode + subpattern + {"{": "}", "[": "]"}[mode]
+                pattern_responses = []
+                for subpattern in subpatterns:
                     # evaluate the sub pattern
-                    pipe_responses.append(self.scan_pattern(subpattern, depth + 1, "|"))
+                    pattern_responses.append(self.scan_pattern(subpattern, depth + 1, parent))
                 # count the matches
-                match_count = [1 if response else 0 for response in pipe_responses].count(1)
-                # check there is no more than 2
-                if match_count >= 2:
+                match_count = sum(map(bool, pattern_responses))
+                # check for some but not all matches
+                if 0 < match_count < len(pattern_responses):
+                    # alert user to invalid arguments
+                    self.display_error("All flags are required in " + pattern)
+                    exit(1)
+                # check for no entries unless parent will handle invalids
+                if match_count == 0 and not parent:
                     # alert user to invalid arguments
-                    self.display_error("Only one part of " + pattern + " can be filled")
+                    self.display_error("All flags are required in " + pattern)
                     exit(1)
-                # required mode
-                if mode == "{":
-                    # check there is exclusively one match
-                    if match_count != 1:
-                        # alert user to invalid arguments
-                        self.display_error("There must be exactly one part of " + pattern + " filled")
-                        exit(1)
-                # initialise return flags
-                return_flags = []
-                # return all set flags
-                for response in pipe_responses:
-                    for flag in response:
-                        return_flags.append(flag)
-                return return_flags
-            # evaluate parts without pipes
             else:
-                # required mode
-                if mode == "{":
-                    # initialise responses
-                    pattern_responses = []
-                    for subpattern in pattern_parts:
-                        # add inherited wrapping if necessary
-                        if subpattern[0] not in ("{", "["):
-                            subpattern = mode + subpattern + {"{": "}", "[": "]"}[mode]
-                        # evaluate the sub pattern
-                        pattern_responses.append(self.scan_pattern(subpattern, depth + 1, parent))
-                    # count the matches
-                    match_count = [1 if response else 0 for response in pattern_responses].count(1)
-                    # check for some but not all matches
-                    if 0 < match_count < len(pattern_responses):
-                        # alert user to invalid arguments
-                        self.display_error("All flags are required in " + pattern)
-                        exit(1)
-                    # check for no entries unless parent will handle invalids
-                    if match_count == 0 and not parent:
-                        # alert user to invalid arguments
-                        self.display_error("All flags are required in " + pattern)
-                        exit(1)
-                else:
-                    # initialise responses
-                    pattern_responses = []
-                    for subpattern in pattern_parts:
-                        # add inherited wrapping if necessary
-                        if subpattern[0] not in ("{", "["):
-                            subpattern = mode + subpattern + {"{": "}", "[": "]"}[mode]
-                        # evaluate the sub pattern
-                        pattern_responses.append(self.scan_pattern(subpattern, depth + 1, "["))
-                # initialise return flags
-                return_flags = []
-                # return all set flags
-                for response in pattern_responses:
-                    for flag in response:
-                        return_flags.append(flag)
-                # add value to satisfy optional mode nested in required mode
-                if mode == "[" and not return_flags:
-                    return_flags.append("-*")
-                return return_flags
+                # initialise responses
+                pattern_responses = []
+                for subpattern in subpatterns:
+                    # evaluate the sub pattern
+                    pattern_responses.append(self.scan_pattern(subpattern, depth + 1, "["))
+            # initialise return flags
+            return_flags = []
+            # return all set flags
+            for response in pattern_responses:
+                for flag in response:
+                    return_flags.append(flag)
+            # add value to satisfy optional mode nested in required mode
+            if mode == "[" and not return_flags:
+                return_flags.append("-*")
+            return return_flags
 
 
     # parse arguments
@@ -398,49 +460,59 @@ class Interface:
             DICT results - information about the command and the various flags it can take"""
         # initialise the command branch
         pattern_branch = self.pattern_tree
+        # forget any previously resolved caller address
+        self._caller_address = None
         # copy assert typing into local namespace
         self.assert_typing = assert_typing
         # copy arguments into local namespace
-        self.given_arguments = [argument for argument in arguments]
+        self.given_arguments = list(arguments)
         # get pattern to match with
-        for argument_index in range(len(self.given_arguments)):
+        for argument_index, argument in enumerate(self.given_arguments):
             # check for help
-            if self.given_arguments[argument_index] == "--help":
+            if argument == "--help":
                 self.display_help()
                 exit(0)
+            # branch into command
+            next_branch = pattern_branch.get(argument)
             # check if command is known
-            if not self.given_arguments[argument_index] in pattern_branch:
+            if next_branch is None:
                 # display error to user
-                self.display_error("Unknown command: " + self.given_arguments[argument_index])
+                self.display_error("Unknown command: " + argument)
                 exit(1)
-            # branch into command
-            pattern_branch = pattern_branch[self.given_arguments[argument_index]]
+            pattern_branch = next_branch
             # add command to internal command path
-            self.internal_command_path.append(self.given_arguments[argument_index])
+            self.internal_command_path.append(argument)
             # detect pattern
-            if type(pattern_branch) == str:
+            if type(pattern_branch) is str:
                 # break out of loop
                 break
-        # remove command path from given arguments
-        for command in self.internal_command_path:
-            self.given_arguments.remove(command)
         # assert that pattern branch is a pattern
-        assert type(pattern_branch) == str
+        assert type(pattern_branch) is str
+        # remove command path from given arguments
+        del self.given_arguments[:argument_index + 1]
+        # resolve the caller address now the command path is known
+        self._caller_address = self.unpack_command_path(self.internal_command_path)
+        self._error_prefix = self._caller_address + ": "
+        self._error_suffix = "\n\tTry: '" + self._caller_address + " --help' for more info\n"
+        # detect help before scanning the pattern
+        if "--help" in self.given_arguments:
+            self.display_help()
+            exit(0)
+        # index parameter information by flag, keeping the first entry for each flag
+        self._param_by_flag = {}
+        for information in self.parameter_information:
+            self._param_by_flag.setdefault(information[0], information)
         # reset results and load arguments to scan
-        self.argument_results = []
+        self.argument_results = {}
+        self._given_counts = Counter(self.given_arguments)
         self.argument_scan = self.given_arguments[argument_index + 1:]
         # start pattern scanning with required pattern
         self.scan_pattern("{" + pattern_branch + "}", 0, "")
         # alert the user to any unknown flags
         if self.given_arguments:
-            # detect help
-            if "--help" in self.given_arguments:
-                self.display_help()
-                exit(0)
-            else:
-                self.display_error("Unrecognised flag " + self.given_arguments[0])
+            self.display_error("Unrecognised flag " + self.given_arguments[0])
         # return the findings
-        return {pair[0]: pair[1] for pair in self.argument_results}
+        return self.argument_results
 
     # open file
     def open_file(self, path, mode):
@@ -451,35 +523,24 @@ class Interface:
         gives:
             _io.TxtIOWrapper - the file object, the same thing returned from open()"""
         # potential file overwrite
-        if path_check.isfile(path) and "w" in mode:
+        if "w" in mode and path_check.isfile(path):
             # unpack internal command path
-            caller_address = self.unpack_command_path(self.internal_command_path if self.internal_command_path else [self.script_name])
+            caller_address = self.get_caller_address()
             # acquire overwrite confirmation
-            user_confirmation = (caller_address + ": File " + path + " already exists, overwrite? [y/n]: ").upper()
+            confirmation_prompt = caller_address + ": File " + path + " already exists, overwrite? [y/n]: "
+            user_confirmation = input(confirmation_prompt).strip().upper()
             while user_confirmation not in ("Y", "N"):
                 print(caller_address + ": Please enter 'Y' or 'N'")
-                user_confirmation = (caller_address + ": File " + path + " already exists, overwrite? [y/n]: ").upper()
+                user_confirmation = input(confirmation_prompt).strip().upper()
             # check for overwrite denial
             if user_confirmation == "N":
                 exit(0)
         # attempt to open the file
         try:
             file = open(path, mode)
-        # permission denied
-        except PermissionError:
-            self.display_error("Permission denied when accessing file " + path)
-            exit(1)
-        # file not found
-        except FileNotFoundError:
-            self.display_error("Could not locate file " + path)
-            exit(1)
-        # file exists
-        except FileExistsError:
-            self.display_error("File " + path + " already exists")
-            exit(1)
-        # catch all
-        except:
-            self.display_error("Could not access file " + path)
+        # alert the user to the reason the file could not be opened
+        except Exception as error:
+            self.display_error(_FILE_ERROR_MESSAGES.get(type(error), "Could not access file {}").format(path))
             exit(1)
         # return IO object
         return file
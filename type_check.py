@@ -14,6 +14,8 @@
 
 # initialise version
 VERSION = "1.0"
+# initialise translation table to strip hex digits
+_HEX_TABLE = str.maketrans("", "", "0123456789abcdefABCDEF")
 
 
 # check int
@@ -23,7 +25,7 @@ def check_int(value):
         STR value - the value to check
     gives:
         BOOL - true if the value is a valid integer, otherwise false"""
-    return all(character.isdigit() for character in value)
+    return value.isascii() and value.isdigit()
 
 
 # check hex
@@ -33,7 +35,7 @@ def check_hex(value):
         STR value - the value to check
     gives:
         BOOL - true is the value is valid hex, otherwise false"""
-    return all(character.upper() in ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "A", "B", "C", "D", "E", "F") for character in value)
+    return bool(value) and not value.translate(_HEX_TABLE)
 
 # initialise type dictionary
 type_dict = {"<INT>": check_int,